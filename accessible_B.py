@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
@@ -7,6 +8,9 @@ a, b, c = 0.5, 0.5, 1.0
 
 # Angle (degrees) measured from the vertical (z) axis to draw contour rings
 angle_from_vertical = 54.7
+theta = math.radians(angle_from_vertical)
+sin_theta = math.sin(theta)
+cos_theta = math.cos(theta)
 
 # Scale factor to enlarge contour rings for visibility
 scale_factor = 1.01
@@ -14,9 +18,16 @@ scale_factor = 1.01
 # Create mesh grid for the ellipsoid surface
 u = np.linspace(0, 2 * np.pi, 100)
 v = np.linspace(0, np.pi, 100)
-x = a * np.outer(np.cos(u), np.sin(v))
-y = b * np.outer(np.sin(u), np.sin(v))
-z = c * np.outer(np.ones_like(u), np.cos(v))
+# Evaluate each trig vector once and broadcast to (len(u), len(v))
+cu = np.cos(u)[:, None]
+su = np.sin(u)[:, None]
+sv = np.sin(v)[None, :]
+cv = np.cos(v)[None, :]
+x = np.multiply(cu, sv)
+x *= a
+y = np.multiply(su, sv)
+y *= b
+z = np.broadcast_to(c * cv, x.shape)
 
 # Create figure and 3D axis
 fig = plt.figure(figsize=(10, 8))
@@ -26,12 +37,11 @@ ax = fig.add_subplot(111, projection='3d')
 ax.plot_surface(x, y, z, cmap='viridis', alpha=0.7, linewidth=0, edgecolor='none')
 
 # Prepare contour rings as line plots
-theta = np.radians(angle_from_vertical)
 u_contour = np.linspace(0, 2 * np.pi, 200)
 
-x_contour = scale_factor * a * np.cos(u_contour) * np.sin(theta)
-y_contour = scale_factor * b * np.sin(u_contour) * np.sin(theta)
-z_contour_pos = scale_factor * c * np.cos(theta) * np.ones_like(u_contour)
+x_contour = scale_factor * a * sin_theta * np.cos(u_contour)
+y_contour = scale_factor * b * sin_theta * np.sin(u_contour)
+z_contour_pos = np.full_like(u_contour, scale_factor * c * cos_theta)
 z_contour_neg = -z_contour_pos
 
 # Plot contour lines
@@ -1,20 +1,22 @@
 import numpy as np
 from dataclasses import dataclass
+from typing import Union
 
 import matplotlib.pyplot as plt
 
 @dataclass
 class AcquisitionParams:
     """Parameters for acquisition system"""
-    photon_count_rate: float  # photons/second
-    readout_time: float  # seconds
-    contrast: float  # signal visibility (0-1)
+    photon_count_rate: Union[float, np.ndarray]  # photons/second
+    readout_time: Union[float, np.ndarray]  # seconds
+    contrast: Union[float, np.ndarray]  # signal visibility (0-1)
     
     def photons_per_readout(self):
         """Calculate expected photons per readout"""
         return self.photon_count_rate * self.readout_time
 
-def calculate_time_to_snr(params: AcquisitionParams, evolution_time: float, target_snr: float) -> float:
+def calculate_time_to_snr(params: AcquisitionParams, evolution_time: Union[float, np.ndarray],
+                          target_snr: float) -> Union[float, np.ndarray]:
     """
     Calculate acquisition time needed to achieve target SNR.
     
@@ -27,11 +29,13 @@ def calculate_time_to_snr(params: AcquisitionParams, evolution_time: float, targ
     
     Args:
         params: AcquisitionParams object
-        evolution_time: time spent evolving the system (not counted in acquisition)
+        evolution_time: time spent evolving the system (not counted in acquisition);
+            a scalar or an array of evolution times
         target_snr: desired signal-to-noise ratio
         
     Returns:
-        Total time including evolution time to achieve target SNR
+        Total time including evolution time to achieve target SNR, with the
+        same shape as evolution_time
     """
     photons = params.photons_per_readout()
     snr_per_readout = params.contrast * np.sqrt(photons)*1/np.sqrt(2)  # factor of sqrt(2) for difference measurement
@@ -49,11 +53,15 @@ def calculate_time_to_snr(params: AcquisitionParams, evolution_time: float, targ
 
 # Example usage
 if __name__ == "__main__":
-    # System parameters
+    # System parameters, one row per acquisition system:
+    #   50k cps, 30% contrast (single NV)
+    #   200k cps, 30% contrast (single NV - Pillared)
+    #   1.5M cps, 8% contrast (Depth = 165 nm Ensemble)
+    # Column arrays broadcast against evolution_times to give a (3, N) result
     system_params = AcquisitionParams(
-        photon_count_rate=50e3,  # 1 MHz
-        readout_time=1e-6,      # 1 ms
-        contrast=0.30            # 50% contrast
+        photon_count_rate=np.array([50e3, 200e3, 1500e3])[:, None],  # photons/second
+        readout_time=1e-6,                                            # 1 us
+        contrast=np.array([0.30, 0.30, 0.08])[:, None]                # signal visibility
     )
 
     target_snr = 5
@@ -61,15 +69,13 @@ if __name__ == "__main__":
     # Array of evolution times
     evolution_times = np.linspace(1e-4, 1e-1, 100)
 
-    # Calculate time to SNR for each evolution time
-    times_to_snr = np.array([
-        calculate_time_to_snr(system_params, evo_time, target_snr)
-        for evo_time in evolution_times
-    ])
+    # Calculate time to SNR for every system and evolution time at once
+    times_to_snr = calculate_time_to_snr(system_params, evolution_times, target_snr)
 
     # Plot results
     fig, ax1 = plt.subplots(figsize=(16, 8))
-    ax1.plot(evolution_times*1e3, times_to_snr/60, linewidth=2)
+    for row in times_to_snr:
+        ax1.plot(evolution_times*1e3, row/60, linewidth=2)
     ax1.set_xlabel("Evolution Time (ms)", fontsize=20)
     ax1.set_ylabel("Averaging Time (min)", fontsize=20)
     ax1.tick_params(axis='both', labelsize=18)
@@ -90,34 +96,6 @@ if __name__ == "__main__":
     
     plt.tight_layout()
 
-    system_params = AcquisitionParams(
-        photon_count_rate=200e3,  # 1 MHz
-        readout_time=1e-6,  # 1 ms
-        contrast=0.30  # 50% contrast
-    )
-    # Calculate time to SNR for each evolution time
-    times_to_snr = np.array(
-        [
-            calculate_time_to_snr(system_params, evo_time, target_snr)
-            for evo_time in evolution_times
-        ]
-    )
-    ax1.plot(evolution_times * 1e3, times_to_snr / 60, linewidth=2)
-    
-    system_params = AcquisitionParams(
-        photon_count_rate=1500e3,  # 1 MHz
-        readout_time=1e-6,      # 1 ms
-        contrast=0.08            # 50% contrast
-    )
-    # Calculate time to SNR for each evolution time
-    times_to_snr = np.array(
-        [
-            calculate_time_to_snr(system_params, evo_time, target_snr)
-            for evo_time in evolution_times
-        ]
-    )
-
-    ax1.plot(evolution_times * 1e3, times_to_snr / 60, linewidth=2)
     ax1.legend(
         [
             "50k cps, 30% contrast (single NV)",
@@ -2,7 +2,10 @@ import numpy as np
 
 import matplotlib.pyplot as plt
 
-def delta_function(x, center, width, amplitude=1.0):
+# FWHM -> sigma conversion factor, 1 / (2 * sqrt(2 * ln 2))
+FWHM_TO_SIGMA = 1 / (2 * np.sqrt(2 * np.log(2)))
+
+def delta_function(x, center, width, amplitude=1.0, out=None):
     """
     Approximates a delta function using a Gaussian.
     
@@ -10,20 +13,34 @@ def delta_function(x, center, width, amplitude=1.0):
     -----------
     x : array-like
         Input values
-    center : float
-        Center position of the delta function
-    width : float
-        Width of the delta function (standard deviation of Gaussian)
-    amplitude : float
+    center : float or array-like
+        Center position of the delta function (broadcast against x)
+    width : float or array-like
+        Width of the delta function (FWHM of Gaussian, broadcast against x)
+    amplitude : float or array-like
         Peak amplitude of the delta function
+    out : ndarray, optional
+        Float buffer to write the result into, shaped like the broadcast of
+        all inputs; reuse it across repeated calls to avoid reallocating
     
     Returns:
     --------
     array-like
         Delta function approximation values
     """
-    sigma = width / (2 * np.sqrt(2 * np.log(2)))  # Convert FWHM to sigma
-    return amplitude * np.exp(-((x - center) ** 2) / (2 * sigma ** 2))
+    sigma = width * FWHM_TO_SIGMA
+    scalar = False
+    if out is None:
+        # Float buffer over the broadcast of every input, so int x and array width/amplitude work
+        shape = np.broadcast_shapes(np.shape(x), np.shape(center), np.shape(width), np.shape(amplitude))
+        out = np.empty(shape, dtype=np.result_type(x, center, width, amplitude, 1.0))
+        scalar = out.ndim == 0
+    np.subtract(x, center, out=out)
+    out *= out
+    out *= -0.5 / (sigma * sigma)
+    np.exp(out, out=out)
+    out *= amplitude
+    return out[()] if scalar else out
 
 
 if __name__ == "__main__":
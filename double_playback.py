@@ -6,20 +6,17 @@ def double_gif_speed(input_path, output_path):
     # Open the original GIF
     original_gif = Image.open(input_path)
 
-    # Extract frames and adjust duration
-    frames = []
+    # Collect halved frame durations (frames are not copied)
     durations = []
     for frame in ImageSequence.Iterator(original_gif):
-        frames.append(frame.copy())
         # Get the frame duration in milliseconds and halve it
         frame_duration = frame.info.get('duration', 100)  # default 100ms
         durations.append(max(1, frame_duration // 2))  # minimum 1ms to avoid zero
 
-    # Save new GIF
-    frames[0].save(
+    # Save new GIF; save_all streams the source frames one at a time
+    original_gif.save(
         output_path,
         save_all=True,
-        append_images=frames[1:],
         duration=durations,
         loop=0,
         disposal=2
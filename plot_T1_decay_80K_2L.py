@@ -8,20 +8,59 @@ Plot T1 decay data with error bars and stretched exponential fit.
 - Note: 80 K 2 Layer CrSBr
 - Publication-ready: 300 DPI, transparent, tight bbox
 """
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 import argparse
 
+# Shared text/grid styling, resolved once instead of per call
+plt.rcParams.update({
+    'axes.titlesize': 34,
+    'axes.labelsize': 40,
+    'xtick.labelsize': 20,
+    'ytick.labelsize': 20,
+    'legend.fontsize': 32,
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'grid.linestyle': '--',
+})
+
 # Toggle: show fit parameters in legend (default True). Use --hide-params to disable.
 SHOW_PARAMS_DEFAULT = False
 
 # Stretched exponential function (no offset): S(t) = A * exp(-(t/tau)^gamma)
+# Evaluated in a single float buffer since curve_fit calls it on every iteration; scalar t gives a scalar
 def stretched_exp(t, A, tau, gamma):
-    return A * np.exp(- (t / tau) ** gamma)
+    out = np.array(t, dtype=float)
+    out /= tau
+    out **= gamma
+    np.negative(out, out=out)
+    np.exp(out, out=out)
+    out *= A
+    return out[()]
+
+# Analytic Jacobian of stretched_exp w.r.t. (A, tau, gamma), shape (N, 3)
+def stretched_exp_jac(t, A, tau, gamma):
+    jac = np.empty((3, len(t)))
+    log_r = np.log(np.divide(t, tau))
+    u = np.exp(gamma * log_r)  # (t/tau)^gamma
+    e = np.exp(-u, out=jac[0])  # dS/dA
+    Aeu = np.multiply(A * e, u, out=u)  # A * e * (t/tau)^gamma
+    np.multiply(Aeu, gamma / tau, out=jac[1])  # dS/dtau
+    np.multiply(Aeu, log_r, out=jac[2])
+    np.negative(jac[2], out=jac[2])  # dS/dgamma
+    return jac.T
 
 # Load data (assume 3 columns: time, signal, error)
-data = np.loadtxt('img/T1_T=80K_2L.csv', delimiter=',', skiprows=1)
+# The CSV is canonical; a binary .npy copy is cached next to it and refreshed whenever the CSV is newer
+csv_path = 'img/T1_T=80K_2L.csv'
+npy_path = 'img/T1_T=80K_2L.npy'
+if os.path.exists(npy_path) and os.path.getmtime(npy_path) >= os.path.getmtime(csv_path):
+    data = np.load(npy_path, mmap_mode='r')
+else:
+    data = np.loadtxt(csv_path, delimiter=',', skiprows=1)
+    np.save(npy_path, data)
 # Data units: time in milliseconds; convert to microseconds for plotting and fitting
 time_ms = data[:, 0]
 time_us = time_ms * 1000.0
@@ -30,12 +69,15 @@ error = data[:, 2]
 
 # Initial parameter guesses: A, tau (µs), gamma
 A0 = signal.max()  # amplitude near max polarization
-tau0 = (time_us.max() - time_us.min()) / 2
-gamma0 = 1.0
+# Linearize: log(-log(S/A)) = gamma*log(t) - gamma*log(tau), so a line fit seeds tau and gamma
+mask = (signal > 0.05 * A0) & (signal < A0)
+gamma0, intercept = np.polyfit(np.log(time_us[mask]), np.log(-np.log(signal[mask] / A0)), 1)
+tau0 = np.exp(-intercept / gamma0)
 p0 = [A0, tau0, gamma0]
 
 # Fit (units: time in microseconds)
-popt, pcov = curve_fit(stretched_exp, time_us, signal, sigma=error, p0=p0, absolute_sigma=True, maxfev=10000)
+popt, pcov = curve_fit(stretched_exp, time_us, signal, sigma=error, p0=p0, absolute_sigma=True,
+                       jac=stretched_exp_jac, maxfev=200)
 A_fit, tau_fit, gamma_fit = popt
 perr = np.sqrt(np.diag(pcov))  # parameter uncertainties
 
@@ -62,13 +104,10 @@ show_params = SHOW_PARAMS_DEFAULT and not args.hide_params
 fit_label = eq_legend if not show_params else (eq_legend + "\n" + params_legend)
 plt.plot(fit_time_us, fit_signal, color='crimson', lw=2.5, label=fit_label)
 
-plt.title(r'Longitudinal Decay ($T_1$)', fontsize=34)
-plt.xlabel(r'$\tau$ (µs)', fontsize=40)
-plt.ylabel('Polarization', fontsize=40)
-plt.xticks(fontsize=20)
-plt.yticks(fontsize=20)
-plt.legend(fontsize=32)
-plt.grid(alpha=0.3, linestyle='--')
+plt.title(r'Longitudinal Decay ($T_1$)')
+plt.xlabel(r'$\tau$ (µs)')
+plt.ylabel('Polarization')
+plt.legend()
 
 # Removed sample note per request
 
@@ -1,14 +1,23 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
 from mpl_toolkits.mplot3d import Axes3D
+from PIL import Image
 
 # Create a grid - only half angle to see interior
-x = np.linspace(-3, 3, 100)
-y = np.linspace(0, 3, 100)  # Only positive y to show half
+# (50x50 matches plot_surface's default rcount/ccount sampling)
+x = np.linspace(-3, 3, 50)
+y = np.linspace(0, 3, 50)  # Only positive y to show half
 X, Y = np.meshgrid(x, y)
 r_squared = X**2 + Y**2
 
+# Quartic coupling and its frame-invariant term
+lambda_param = 0.5
+lambda_r4 = lambda_param * r_squared**2
+
+# Smooth cutoff parameters
+cutoff_height = 3.0
+smoothness = 0.5  # Controls transition width (smaller = sharper)
+
 # Number of frames
 n_frames = 30
 
@@ -22,39 +31,14 @@ max_height = 3.0
 # Set up the figure
 fig = plt.figure(figsize=(10, 8))
 ax = fig.add_subplot(111, projection="3d")
+surf = None
 
 
-def update(frame):
-    ax.clear()
-
-    # Sombrero potential: V = -mu^2 * r^2 + lambda * r^4
-    # When mu^2 < 0: minimum at r=0 (no symmetry breaking)
-    # When mu^2 > 0: minimum at r = sqrt(mu^2/(2*lambda)) (symmetry broken)
-    mu_sq = mu_squared_values[frame]
-    lambda_param = 0.5
-
-    V = -mu_sq * r_squared + lambda_param * r_squared**2
-
-    # Smooth cutoff using a sigmoid function
-    V_masked = np.copy(V)
-    cutoff_height = 3.0
-    smoothness = 0.5  # Controls transition width (smaller = sharper)
-
-    # Create smooth transition: 1 where V < cutoff, 0 where V > cutoff
-    smooth_mask = 1 / (1 + np.exp((V - cutoff_height) / smoothness))
-    V_masked = V_masked * smooth_mask
-    V_masked[smooth_mask < 0.01] = np.nan  # Hide nearly zero values
-
-    # Plot surface
-    surf = ax.plot_surface(
-        X, Y, V_masked, cmap="viridis", alpha=0.8, linewidth=0, antialiased=True
-    )
-
-    # Set labels and title
+def init():
+    # Static labels, limits and view; set once before the frame loop
     ax.set_xlabel("φ₁", fontsize=12)
     ax.set_ylabel("φ₂", fontsize=12)
     ax.set_zlabel("V(φ)", fontsize=12)
-    ax.set_title(f"Sombrero Potential: μ² = {mu_sq:.2f}", fontsize=14)
 
     # Set consistent z-limits for smooth animation
     ax.set_zlim(-3, 4)
@@ -64,15 +48,54 @@ def update(frame):
     # Fixed viewing angle to see the cross-section
     ax.view_init(elev=20, azim=-90)
 
-    return (surf,)
 
+def update(frame):
+    global surf
+
+    # Sombrero potential: V = -mu^2 * r^2 + lambda * r^4
+    # When mu^2 < 0: minimum at r=0 (no symmetry breaking)
+    # When mu^2 > 0: minimum at r = sqrt(mu^2/(2*lambda)) (symmetry broken)
+    mu_sq = mu_squared_values[frame]
+
+    V = np.multiply(-mu_sq, r_squared)
+    V += lambda_r4
+
+    # Smooth cutoff using a sigmoid function: mask = 1 / (1 + exp((V - cutoff) / smoothness))
+    # is 1 where V < cutoff, 0 where V > cutoff; build its denominator in place
+    denom = V - cutoff_height
+    denom /= smoothness
+    np.exp(denom, out=denom)
+    denom += 1
+    V_masked = V
+    V_masked /= denom
+    V_masked[denom > 100] = np.nan  # Hide nearly zero values (mask < 0.01)
+
+    # Replace only the previous frame's surface
+    if surf is not None:
+        surf.remove()
+    surf = ax.plot_surface(
+        X, Y, V_masked, cmap="viridis", alpha=0.8, linewidth=0, antialiased=True
+    )
+    ax.set_title(f"Sombrero Potential: μ² = {mu_sq:.2f}", fontsize=14)
 
-# Create animation
-anim = FuncAnimation(fig, update, frames=n_frames, interval=100, blit=False)
 
-# Save as GIF
-writer = PillowWriter(fps=10)
-anim.save("sombrero_potential.gif", writer=writer)
+# Render each frame straight from the Agg canvas buffer (no per-frame savefig)
+init()
+frames = []
+for frame in range(n_frames):
+    update(frame)
+    fig.canvas.draw()
+    # Opaque frames go to Pillow as RGB, as PillowWriter does, so the GIF palette has no transparency
+    frames.append(Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert("RGB"))
+
+# Save as GIF (10 fps), encoding all frames in one pass
+frames[0].save(
+    "sombrero_potential.gif",
+    save_all=True,
+    append_images=frames[1:],
+    duration=100,
+    loop=0,
+)
 print("Animation saved as 'sombrero_potential.gif'")
 
 plt.close()
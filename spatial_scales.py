@@ -1,7 +1,33 @@
+import hashlib
+import os
+import sys
+
+# Set SHOW_PLOTS=1 to open the interactive window; otherwise render headless with Agg
+SHOW_PLOTS = bool(os.environ.get('SHOW_PLOTS'))
+
+# All inputs are constants in this file, so the figure only changes when the source does.
+# Skip rendering if the PNG exists and was produced from identical source (delete the .sha1 to force)
+OUTPUT_PATH = r'./img/spatial_scales.png'
+HASH_PATH = OUTPUT_PATH + '.sha1'
+with open(__file__, 'rb') as src:
+    src_hash = hashlib.sha1(src.read()).hexdigest()
+if not SHOW_PLOTS and os.path.exists(OUTPUT_PATH) and os.path.exists(HASH_PATH):
+    with open(HASH_PATH) as f:
+        if f.read().strip() == src_hash:
+            print("'spatial_scales.png' is up to date")
+            sys.exit(0)
+
 import numpy as np
+import matplotlib
+
+if not SHOW_PLOTS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FixedLocator, NullFormatter
 from matplotlib.patches import Patch
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.lines import TICKDOWN
 
 # Create figure with two vertically stacked subplots sharing x-axis
 fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), sharex=True, 
@@ -11,51 +37,73 @@ fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), sharex=True,
 x_min = 1e-9  # 1 nm
 x_max = 1e-3  # 1 mm
 
-# ============== UPPER PLOT: Phenomena Length Scales ==============
-ax1.set_xscale('log')
-ax1.set_xlim(x_min, x_max)
-ax1.set_ylim(0, 0.55)
 
-# Remove spines
-ax1.spines['top'].set_visible(False)
-ax1.spines['right'].set_visible(False)
-ax1.spines['left'].set_visible(False)
-ax1.spines['bottom'].set_visible(True)
-ax1.spines['bottom'].set_linewidth(3)
-ax1.spines['bottom'].set_color('black')
+def bar_verts(bars):
+    """Corners of horizontal bars given as (start, end, y_center, height) rows; returns an (N, 4, 2) array."""
+    bars = np.asarray(bars)
+    x = bars[:, [0, 1, 1, 0]]
+    y = bars[:, 2:3] + bars[:, 3:4] * np.array([-0.5, -0.5, 0.5, 0.5])
+    return np.stack([x, y], axis=-1)
+
+
+# Bars collected per axis as (start, end, y_center, height) rows and drawn as one PolyCollection each
+ax1_bars = []
+ax2_bars = []
+ax2_hatched_bars = []
 
-# Remove y-axis
-ax1.yaxis.set_visible(False)
+# Bar annotations as (axes, x, y, text, fontsize, ha); all drawn in one pass below
+bar_labels = []
 
-# Disable automatic tick labels
-ax1.tick_params(axis='x', which='both', labelbottom=False)
+# ============== SHARED AXIS SETUP ==============
+for ax in (ax1, ax2):
+    ax.set_xscale('log')
+    ax.set_xlim(x_min, x_max)
 
-# Set major tick positions (no labels)
-tick_positions = [1e-9, 1e-6, 1e-3]
-ax1.xaxis.set_major_locator(FixedLocator(tick_positions))
-ax1.xaxis.set_major_formatter(NullFormatter())
-ax1.tick_params(axis='x', which='major', length=25, width=3, pad=15, direction='out', top=False)
+    # Keep only a thick bottom spine
+    ax.spines[['top', 'right', 'left']].set_visible(False)
+    ax.spines['bottom'].set(visible=True, linewidth=3, color='black')
 
-# Decade and minor ticks
-decade_ticks = [1e-8, 1e-7, 1e-5, 1e-4]
-minor_ticks = []
-for exp in range(-9, -2):
-    for sub in range(2, 10):
-        minor_ticks.append(sub * 10**exp)
+    # Remove y-axis and automatic tick labels
+    ax.yaxis.set_visible(False)
+    ax.tick_params(axis='x', which='both', labelbottom=False)
 
-for tick in decade_ticks:
-    ax1.plot([tick, tick], [0, -0.02], color='black', linewidth=1.5, clip_on=False, transform=ax1.get_xaxis_transform())
+    # Ticks and grid lines are drawn directly by add_ticks, so the axis locators stay empty
+    # and no Tick objects are built
+    ax.xaxis.set_major_locator(FixedLocator([]))
+    ax.xaxis.set_major_formatter(NullFormatter())
+    ax.xaxis.set_minor_locator(FixedLocator([]))
+    ax.xaxis.set_minor_formatter(NullFormatter())
 
-for tick in minor_ticks:
-    if x_min <= tick <= x_max:
-        ax1.plot([tick, tick], [0, -0.035], color='black', linewidth=1.5, clip_on=False, transform=ax1.get_xaxis_transform())
+# Major tick positions (no labels): every decade from 1 nm to 1 mm
+tick_positions = 10.0**np.arange(-9, -2)
 
-ax1.xaxis.set_minor_locator(FixedLocator([]))
-ax1.xaxis.set_minor_formatter(NullFormatter())
+# Minor ticks
+minor_ticks = np.outer(np.arange(2, 10), 10.0**np.arange(-9, -2)).ravel()  # 2-9 x each decade
+minor_ticks = minor_ticks[(minor_ticks >= x_min) & (minor_ticks <= x_max)]
+
+# Grid lines and minor tick marks as line segments in (data x, axes y) coordinates,
+# built once and shared by both axes
+grid_segments = [[(tick, 0), (tick, 1)] for tick in tick_positions]
+tick_segments = [[(tick, 0), (tick, -0.035)] for tick in minor_ticks]
+
+
+def add_ticks(ax, positions, grid_segments, tick_segments):
+    """Draw major ticks, major grid lines and minor tick marks on ax without creating Tick objects."""
+    xtrans = ax.get_xaxis_transform()
+    # Grid lines below the bars (zorder 0.5, as with set_axisbelow)
+    ax.add_collection(LineCollection(grid_segments, colors='gray', alpha=0.4, linewidths=1.5, capstyle='projecting',
+                                     zorder=0.5, transform=xtrans), autolim=False)
+    # Major ticks: 25 pt outward marks, the same marker a Tick draws
+    ax.plot(positions, np.zeros_like(positions), linestyle='none', marker=TICKDOWN, markersize=25,
+            markeredgewidth=3, color='black', clip_on=False, zorder=0.5, transform=xtrans)
+    ax.add_collection(LineCollection(tick_segments, colors='black', linewidths=1.5, capstyle='projecting',
+                                     clip_on=False, transform=xtrans), autolim=False)
+
+
+# ============== UPPER PLOT: Phenomena Length Scales ==============
+ax1.set_ylim(0, 0.55)
 
-# Grid lines
-ax1.grid(True, which='major', axis='x', alpha=0.4, linestyle='-', linewidth=1.5, color='gray')
-ax1.set_axisbelow(True)
+add_ticks(ax1, tick_positions, grid_segments, tick_segments)
 
 # Title for upper plot
 ax1.set_title('Phenomena Length Scales', fontsize=36, fontweight='bold', pad=20)
@@ -73,20 +121,17 @@ sv_y = 0.48
 sv_height = 0.11
 
 # ξ segment (gray fill)
-ax1.barh(sv_y, xi_end - xi_start, left=xi_start, height=sv_height,
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax1_bars.append((xi_start, xi_end, sv_y, sv_height))
 
 # λ_L segment (solid fill)
-ax1.barh(sv_y, lambda_end - lambda_start, left=lambda_start, height=sv_height,
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax1_bars.append((lambda_start, lambda_end, sv_y, sv_height))
 
 # Main label
-ax1.text(x_max/1.3, sv_y - 0.005, 'SC Vortices',
-         fontsize=28, ha='right', va='center', color='black')
+bar_labels.append((ax1, x_max/1.3, sv_y - 0.005, 'SC Vortices', 28, 'right'))
 
 # Segment annotations (placed at left side of boxes)
-ax1.text(xi_start * 1.5, sv_y - 0.005, r'$\xi_c$', fontsize=24, ha='left', va='center', color='black')
-ax1.text(lambda_start * 1.2, sv_y - 0.005, r'$\lambda_{L}$', fontsize=24, ha='left', va='center', color='black')
+bar_labels.append((ax1, xi_start * 1.5, sv_y - 0.005, r'$\xi_c$', 24, 'left'))
+bar_labels.append((ax1, lambda_start * 1.2, sv_y - 0.005, r'$\lambda_{L}$', 24, 'left'))
 
 """Electron Transport length scales: mean free path (l_mc) and momentum relaxation (l_mr)."""
 # e^- Transport bar spanning from 80 nm to 10 μm
@@ -97,15 +142,13 @@ et_y = 0.22
 et_height = 0.11
 
 # Single bar spanning full range
-ax1.barh(et_y, et_end - et_start, left=et_start, height=et_height,
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax1_bars.append((et_start, et_end, et_y, et_height))
 
 # Main label
-ax1.text(x_max/1.3, et_y - 0.005, r'$e^{-}$ Transport',
-         fontsize=28, ha='right', va='center', color='black')
+bar_labels.append((ax1, x_max/1.3, et_y - 0.005, 'e⁻ Transport', 28, 'right'))
 
 # Combined label with comma inside the box
-ax1.text(et_start * 1.5, et_y - 0.005, r'$l_{mc}, l_{mr}$', fontsize=24, ha='left', va='center', color='black')
+bar_labels.append((ax1, et_start * 1.5, et_y - 0.005, r'$l_{mc}, l_{mr}$', 24, 'left'))
 
 # Magnetic Domains bar: 15 nm to 1 mm
 md_start = 15e-9   # 15 nm
@@ -113,11 +156,9 @@ md_end = 1e-3      # 1 mm
 md_y = 0.35
 md_height = 0.11
 
-ax1.barh(md_y, md_end - md_start, left=md_start, height=md_height,
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax1_bars.append((md_start, md_end, md_y, md_height))
 
-ax1.text(x_max/1.3, md_y - 0.005, 'Magnetic Domains',
-         fontsize=28, ha='right', va='center', color='black')
+bar_labels.append((ax1, x_max/1.3, md_y - 0.005, 'Magnetic Domains', 28, 'right'))
 
 # AFM/FM Magnons bar: 1 nm to 1 mm
 magnon_start = 1e-9   # 1 nm
@@ -125,59 +166,27 @@ magnon_end = 1e-3     # 1 mm
 magnon_y = 0.09
 magnon_height = 0.11
 
-ax1.barh(magnon_y, magnon_end - magnon_start, left=magnon_start, height=magnon_height,
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax1_bars.append((magnon_start, magnon_end, magnon_y, magnon_height))
 
-ax1.text(x_max/1.3, magnon_y - 0.005, 'AFM/FM Magnons',
-         fontsize=28, ha='right', va='center', color='black')
+bar_labels.append((ax1, x_max/1.3, magnon_y - 0.005, 'AFM/FM Magnons', 28, 'right'))
+
+ax1.add_collection(PolyCollection(bar_verts(ax1_bars), facecolors='lightgray', edgecolors='black', linewidths=2,
+                                  rasterized=True), autolim=False)
 
 # ============== HORIZONTAL DIVIDER LINE ==============
 # Draw black line between plots using figure coordinates (positioned between plots)
 fig.add_artist(plt.Line2D([0.05, 0.95], [0.52, 0.52], color='black', linewidth=3, transform=fig.transFigure))
 
 # ============== LOWER PLOT: Accessible Length Scales ==============
-ax2.set_xscale('log')
-ax2.set_xlim(x_min, x_max)
 ax2.set_ylim(0, 0.7)
 
-# Remove spines
-ax2.spines['top'].set_visible(False)
-ax2.spines['right'].set_visible(False)
-ax2.spines['left'].set_visible(False)
-ax2.spines['bottom'].set_visible(True)
-ax2.spines['bottom'].set_linewidth(3)
-ax2.spines['bottom'].set_color('black')
-
-# Remove y-axis
-ax2.yaxis.set_visible(False)
-
-# Disable automatic tick labels
-ax2.tick_params(axis='x', which='both', labelbottom=False)
-
-# Set major tick positions (no labels)
-ax2.xaxis.set_major_locator(FixedLocator(tick_positions))
-ax2.xaxis.set_major_formatter(NullFormatter())
-ax2.tick_params(axis='x', which='major', length=25, width=3, pad=15, direction='out', top=False)
-
-# Decade and minor ticks
-for tick in decade_ticks:
-    ax2.plot([tick, tick], [0, -0.02], color='black', linewidth=1.5, clip_on=False, transform=ax2.get_xaxis_transform())
-
-for tick in minor_ticks:
-    if x_min <= tick <= x_max:
-        ax2.plot([tick, tick], [0, -0.035], color='black', linewidth=1.5, clip_on=False, transform=ax2.get_xaxis_transform())
-
-ax2.xaxis.set_minor_locator(FixedLocator([]))
-ax2.xaxis.set_minor_formatter(NullFormatter())
+# Major ticks, grid lines and minor ticks
+add_ticks(ax2, tick_positions, grid_segments, tick_segments)
 
 # Manually place text labels at tick positions (only on bottom plot)
-ax2.text(1e-9, -0.11, '1 nm', fontsize=32, fontweight='bold', ha='center', va='top', transform=ax2.get_xaxis_transform())
-ax2.text(1e-6, -0.11, '1 μm', fontsize=32, fontweight='bold', ha='center', va='top', transform=ax2.get_xaxis_transform())
-ax2.text(1e-3, -0.11, '1 mm', fontsize=32, fontweight='bold', ha='center', va='top', transform=ax2.get_xaxis_transform())
-
-# Grid lines
-ax2.grid(True, which='major', axis='x', alpha=0.4, linestyle='-', linewidth=1.5, color='gray')
-ax2.set_axisbelow(True)
+xtrans2 = ax2.get_xaxis_transform()
+for tick, label in ((1e-9, '1 nm'), (1e-6, '1 μm'), (1e-3, '1 mm')):
+    ax2.text(tick, -0.11, label, fontsize=32, fontweight='bold', ha='center', va='top', transform=xtrans2)
 
 # Title for lower plot - placed above the plot area
 ax2.set_title('Measurable Length Scales', fontsize=36, fontweight='bold', pad=20)
@@ -188,18 +197,9 @@ single_nv_end = 1e-3    # 1 mm
 bar_y1 = 0.35
 bar_height = 0.11
 
-ax2.barh(bar_y1, single_nv_end - single_nv_start, left=single_nv_start, height=bar_height, 
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax2_bars.append((single_nv_start, single_nv_end, bar_y1, bar_height))
 
-ax2.text(
-    x_max / 1.3,
-    bar_y1 - 0.005,
-    "Single NV",
-    fontsize=28,
-    ha="right",
-    va="center",
-    color="black",
-)
+bar_labels.append((ax2, x_max / 1.3, bar_y1 - 0.005, "Single NV", 28, "right"))
 
 # δ-Doped Ensemble bar - MIDDLE bar
 delta_start = 6e-9      # 6 nm
@@ -207,52 +207,42 @@ delta_mid = 500e-9      # 500 nm
 delta_end = 1e-3        # 1 mm
 bar_y2 = 0.22
 
-# Draw solid portion from 500 nm to 1 mm
-ax2.barh(bar_y2, delta_end - delta_mid, left=delta_mid, height=bar_height, 
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
-
-# Draw dashed/hatched portion from 6 nm to 500 nm
-ax2.barh(bar_y2, delta_mid - delta_start, left=delta_start, height=bar_height, 
-         color='white', edgecolor='black', linewidth=2, align='center', log=True, 
-         hatch='///', alpha=0.5)
-
-ax2.text(
-    x_max / 1.3,
-    bar_y2 - 0.005,
-    r"$\delta$-Doped Ensemble",
-    fontsize=28,
-    ha="right",
-    va="center",
-    color="black",
-)
+# Solid portion from 500 nm to 1 mm
+ax2_bars.append((delta_mid, delta_end, bar_y2, bar_height))
+
+# Dashed/hatched portion from 6 nm to 500 nm
+ax2_hatched_bars.append((delta_start, delta_mid, bar_y2, bar_height))
+
+bar_labels.append((ax2, x_max / 1.3, bar_y2 - 0.005, "δ-Doped Ensemble", 28, "right"))
 
 # Single NV Scanning Probe bar - BOTTOM bar
 nv_start = 40e-9  # 40 nm
 nv_end = 1e-3     # 1 mm
 bar_y3 = 0.09
 
-ax2.barh(bar_y3, nv_end - nv_start, left=nv_start, height=bar_height, 
-         color='lightgray', edgecolor='black', linewidth=2, align='center', log=True)
+ax2_bars.append((nv_start, nv_end, bar_y3, bar_height))
 
-ax2.text(
-    x_max / 1.3,
-    bar_y3 - 0.005,
-    "Single NV Scanning Probe",
-    fontsize=28,
-    ha="right",
-    va="center",
-    color="black",
-)
+bar_labels.append((ax2, x_max / 1.3, bar_y3 - 0.005, "Single NV Scanning Probe", 28, "right"))
+
+ax2.add_collection(PolyCollection(bar_verts(ax2_bars), facecolors='lightgray', edgecolors='black', linewidths=2,
+                                  rasterized=True), autolim=False)
+ax2.add_collection(PolyCollection(bar_verts(ax2_hatched_bars), facecolors='white', edgecolors='black', linewidths=2,
+                                  hatch='///', alpha=0.5, rasterized=True), autolim=False)
+
+# Bar annotations for both plots
+for ax, x, y, label, fontsize, ha in bar_labels:
+    ax.text(x, y, label, fontsize=fontsize, ha=ha, va='center', color='black')
 
 # Legend (place in lower plot)
 hatched_proxy = Patch(facecolor='white', edgecolor='black', hatch='///', label='Z Resolved, XY Averaged')
 solid_proxy = Patch(facecolor='lightgray', edgecolor='black', label='XYZ Resolved')
 ax2.legend(handles=[hatched_proxy, solid_proxy], loc='upper left', fontsize=18, frameon=False)
 
-plt.tight_layout()
-
-# Save high-resolution figure
-plt.savefig(r'./img/spatial_scales.png', transparent=True, dpi=300, bbox_inches='tight')
+# Save high-resolution figure (layout is fixed by figsize/gridspec; bbox_inches='tight' crops in one pass)
+plt.savefig(OUTPUT_PATH, transparent=True, dpi=300, bbox_inches='tight')
+with open(HASH_PATH, 'w') as f:
+    f.write(src_hash + '\n')
 print("Saved 'spatial_scales.png'")
 
-plt.show()
+if SHOW_PLOTS:
+    plt.show()